@@ -76,7 +76,9 @@ async def ble_client_task():
     # Update connection status on the Tkinter UI (in the monolith thread)
     root.after(0, lambda: conn_status_label.config(text=f"BLE: Connected to {target.address}"))
 
-    async with BleakClient(target.address) as client:
+    disconnect_event = asyncio.Event()
+    async with BleakClient(target.address,
+                           disconnected_callback=lambda c: disconnect_event.set()) as client:
         if not client.is_connected:
             log_message("Failed to connect.")
             return
@@ -164,9 +166,8 @@ async def ble_client_task():
                 log_message(f"Failed to start notify: {e}. Retrying in 5 seconds...")
                 await asyncio.sleep(5)
 
-        # Keep the connection open indefinitely (or until the device disconnects)
-        while client.is_connected:
-            await asyncio.sleep(1)
+        # Keep the connection open until the device disconnects
+        await disconnect_event.wait()
 
         await client.stop_notify(CHARACTERISTIC_UUID)
 
@@ -6,20 +6,53 @@ to adjust system volume and trigger media control gestures.
 """
 
 import asyncio
+import math
+import os
 import time
 import keyboard  # May require admin privileges
 from bleak import BleakScanner, BleakClient
-from utils.volume_control import volume_control, map_pitch_to_volume
+from ble.sensor_packet import parse_sensor_packet
+from utils.volume_control import get_volume_control, adjust_volume
 from ui.ui_manager import UIManager  # For type hints (optional)
 
 # BLE service and characteristic UUIDs
 SERVICE_UUID = "0000a000-0000-1000-8000-00805f9b34fb"
 CHARACTERISTIC_UUID = "0000a001-0000-1000-8000-00805f9b34fb"
+SERVICE_UUID_LC = SERVICE_UUID.lower()
+
+# BLE scan parameters
+scan_timeout = 10.0         # Seconds to scan for the target device before giving up
+connect_timeout = 5.0       # Seconds to wait for a connection to be established
+
+# Address of the last connected device, tried directly before scanning on the next launch
+LAST_DEVICE_FILE = os.path.join(os.path.expanduser("~"), ".gyro_last_device")
+
+# Sensor processing
+sample_queue_size = 4       # Pending samples kept when processing falls behind (oldest dropped)
+filter_alpha = 0.2          # Low-pass smoothing factor: y = alpha * x + (1 - alpha) * y_prev
 
 # Gesture parameters
 yaw_threshold = 0.3         # Threshold for detecting play/pause gesture (yaw)
 gesture_cooldown = 1.0      # Cooldown in seconds between gesture triggers
 
+# Volume parameters
+volume_quantum = 0.01       # Minimum volume change (1%) worth writing to the audio endpoint
+volume_write_interval = 0.05  # Seconds between volume writes to the audio endpoint
+
+def _load_last_address():
+    try:
+        with open(LAST_DEVICE_FILE, encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+def _save_last_address(address: str):
+    try:
+        with open(LAST_DEVICE_FILE, "w", encoding="utf-8") as f:
+            f.write(address)
+    except OSError:
+        pass
+
 class BLEClient:
     """
     BLEClient handles scanning for the target BLE peripheral, connecting to it,
@@ -32,90 +65,194 @@ class BLEClient:
         self.previous_pitch = None
         self.last_pitch_time = 0
         self.last_gesture_time = 0
+        self._roll_f = self._pitch_f = self._yaw_f = None  # Low-pass filtered sensor values
+        self._cached_vol = 0.0      # Last known volume, avoids a COM read per notification
+        self._written_vol = 0.0     # Last volume actually written to the audio endpoint
+        self._pending_vol = 0.0     # Volume waiting to be written by _volume_writer
+        self._vol_dirty = None      # asyncio.Event set when _pending_vol needs writing, created in _session()
+        self._samples = None        # Bounded queue of (roll, pitch, yaw) samples, created in _session()
+        self._volume_control = None  # pycaw endpoint, activated on the BLE thread in run()
 
     async def run(self):
+        self._volume_control = get_volume_control()
+        address = _load_last_address()
+        if address is not None:
+            self.ui.log_message(f"Connecting to last known device ({address})...")
+            try:
+                if await self._session(address):
+                    return
+            except Exception as e:
+                # A stale address can fail in many ways; any of them means "scan instead".
+                self.ui.log_message(f"Direct connection failed: {e}")
+
         self.ui.log_message("Scanning for BLE devices...")
-        devices = await BleakScanner.discover()
-        target = None
-        for d in devices:
-            if SERVICE_UUID.lower() in [s.lower() for s in d.metadata.get("uuids", [])]:
-                target = d
-                break
+        # Stop scanning as soon as the target service is seen; service_uuids lets the
+        # backend filter advertisements before they reach Python.
+        target = await BleakScanner.find_device_by_filter(
+            lambda d, ad: any(u.lower() == SERVICE_UUID_LC for u in ad.service_uuids or ()),
+            timeout=scan_timeout,
+            service_uuids=[SERVICE_UUID],
+        )
         if target is None:
             self.ui.log_message("No device with the target service found.")
             return
         self.ui.log_message(f"Found target device: {target.name} ({target.address})")
-        self.ui.update_connection_status(target.address, connected=True)
+        await self._session(target.address)
 
-        async with BleakClient(target.address) as client:
+    async def _session(self, address: str) -> bool:
+        """
+        Connect to the device at the given address and stream notifications until it
+        disconnects. Returns False if the connection could not be established or the
+        device does not expose the gyro service.
+        """
+        disconnect_event = asyncio.Event()
+        # Reuse the OS GATT cache (WinRT) instead of re-enumerating services on every connect.
+        async with BleakClient(address,
+                               disconnected_callback=lambda c: disconnect_event.set(),
+                               timeout=connect_timeout,
+                               winrt=dict(use_cached_services=True)) as client:
             if not client.is_connected:
                 self.ui.log_message("Failed to connect.")
-                return
+                return False
+            if client.services.get_service(SERVICE_UUID) is None:
+                self.ui.log_message("Device does not expose the gyro service.")
+                return False
             self.ui.log_message("Connected to BLE device.")
-
-            def notification_handler(sender, data):
-                """
-                Process incoming notifications:
-                - Update sensor labels.
-                - When phone is held level (pitch between -1.5 and -0.5), adjust volume based on roll.
-                - When phone is tilted forward (pitch > -0.7) with significant pitch change, trigger play/pause.
-                """
-                try:
-                    decoded = data.decode("utf-8").strip()
-                    values = decoded.split(",")
-                    if len(values) >= 3:
-                        roll, pitch, yaw = map(float, values[:3])
-                        self.ui.update_sensor_labels(roll, pitch, yaw)
-
-                        # Volume Adjustment: when phone is held level (pitch between -1.5 and -0.5)
-                        if -1.5 <= pitch <= -0.5:
-                            self.ui.last_volume_disabled_logged = False  # Reset flag when level
-                            current_vol = volume_control.GetMasterVolumeLevelScalar()
-                            tilt_threshold = 0.2  # Deadzone for roll
-                            rate_factor = 0.02    # Sensitivity factor for volume change
-                            new_vol = current_vol
-                            if roll < -tilt_threshold:
-                                new_vol = current_vol - rate_factor * (abs(roll) - tilt_threshold)
-                            elif roll > tilt_threshold:
-                                new_vol = current_vol + rate_factor * (roll - tilt_threshold)
-                            new_vol = max(0.0, min(1.0, new_vol))
-                            volume_control.SetMasterVolumeLevelScalar(new_vol, None)
-                            self.ui.update_volume_label(new_vol)
-                            self.ui.throttled_log(f"Volume adjusted: roll={roll:.2f} -> Volume: {int(new_vol * 100)}%")
-                        else:
-                            if not self.ui.last_volume_disabled_logged:
-                                self.ui.log_message("Volume control disabled (phone not held level)")
-                                self.ui.last_volume_disabled_logged = True
-
-                        # Play/Pause Gesture: when phone is tilted forward (pitch > -0.7)
-                        # Trigger only if pitch changes by more than 0.1 and cooldown has passed.
-                        pitch_delta_threshold = 0.1
-                        if pitch > -0.7:
-                            current_time = time.time()
-                            if ((self.previous_pitch is None or abs(pitch - self.previous_pitch) > pitch_delta_threshold) and
-                                (current_time - self.last_pitch_time > gesture_cooldown)):
-                                keyboard.send("play/pause media")
-                                self.last_pitch_time = current_time
-                                self.ui.log_message("Gesture detected: Toggling Play/Pause")
-                        self.previous_pitch = pitch
-                        self.previous_yaw = yaw
-                except Exception as e:
-                    self.ui.log_message(f"Notification error: {e}")
+            self.ui.update_connection_status(address, connected=True)
+            _save_last_address(address)
+            self._cached_vol = self._written_vol = await asyncio.to_thread(
+                self._volume_control.GetMasterVolumeLevelScalar)
+            self.ui.update_volume_label(self._cached_vol)
+            self._samples = asyncio.Queue(maxsize=sample_queue_size)
+            self._vol_dirty = asyncio.Event()
 
             # Retry loop for starting notifications.
             while True:
                 try:
-                    await client.start_notify(CHARACTERISTIC_UUID, notification_handler)
+                    await client.start_notify(CHARACTERISTIC_UUID, self._on_notify)
                     self.ui.log_message("Subscribed to notifications. Waiting for data...")
                     break
                 except Exception as e:
                     self.ui.log_message(f"Failed to start notify: {e}. Retrying in 5 seconds...")
-                    asyncio.sleep(5)
+                    await asyncio.sleep(5)
 
-            # Keep the connection alive
-            while client.is_connected:
-                await asyncio.sleep(1)
+            consumer_task = asyncio.create_task(self._sensor_consumer())
+            writer_task = asyncio.create_task(self._volume_writer())
+
+            # Keep the connection alive until the device disconnects.
+            await disconnect_event.wait()
+            consumer_task.cancel()
+            writer_task.cancel()
+            await asyncio.gather(consumer_task, writer_task, return_exceptions=True)
+            # Flush a volume change that was still waiting for the writer.
+            if self._vol_dirty.is_set():
+                await self._write_pending_volume()
             try:
                 await client.stop_notify(CHARACTERISTIC_UUID)
             except Exception as e:
                 self.ui.log_message(f"Error stopping notifications: {e}")
+        return True
+
+    def _on_notify(self, sender, data: bytearray):
+        """
+        Parse incoming notifications and queue the samples for _sensor_consumer.
+        When the consumer falls behind, the oldest queued sample is dropped.
+        """
+        try:
+            values = parse_sensor_packet(data)
+            if values is not None:
+                try:
+                    self._samples.put_nowait(values)
+                except asyncio.QueueFull:
+                    self._samples.get_nowait()
+                    self._samples.put_nowait(values)
+        except Exception as e:
+            self.ui.log_message(f"Notification error: {e}")
+
+    async def _sensor_consumer(self):
+        """
+        Take queued sensor samples and process them one by one, so that volume,
+        gesture and UI work never runs inside the notification callback.
+        """
+        while True:
+            roll, pitch, yaw = await self._samples.get()
+            try:
+                self._process_sample(roll, pitch, yaw)
+            except Exception as e:
+                self.ui.log_message(f"Processing error: {e}")
+
+    def _process_sample(self, roll: float, pitch: float, yaw: float):
+        """
+        Process one sensor sample:
+        - Update sensor labels.
+        - When phone is held level (pitch between -1.5 and -0.5), adjust volume based on roll.
+        - When phone is tilted forward (pitch > -0.7) with significant pitch change, trigger play/pause.
+        """
+        # Binary frames can carry NaN/Inf; one such sample would poison the filter state.
+        if not (math.isfinite(roll) and math.isfinite(pitch) and math.isfinite(yaw)):
+            return
+        if self._roll_f is None:
+            # Seed the filter with the first sample to avoid a ramp from zero.
+            self._roll_f, self._pitch_f, self._yaw_f = roll, pitch, yaw
+        else:
+            self._roll_f += filter_alpha * (roll - self._roll_f)
+            self._pitch_f += filter_alpha * (pitch - self._pitch_f)
+            self._yaw_f += filter_alpha * (yaw - self._yaw_f)
+        roll, pitch, yaw = self._roll_f, self._pitch_f, self._yaw_f
+        self.ui.update_sensor_labels(roll, pitch, yaw)
+
+        # Volume Adjustment: when phone is held level (pitch between -1.5 and -0.5)
+        if -1.5 <= pitch <= -0.5:
+            self.ui.last_volume_disabled_logged = False  # Reset flag when level
+            new_vol = adjust_volume(roll, self._cached_vol)
+            self._cached_vol = new_vol
+            # Only queue a write when the change is noticeable, or when hitting a bound.
+            if (abs(new_vol - self._written_vol) > volume_quantum or
+                    (new_vol != self._written_vol and new_vol in (0.0, 1.0))):
+                self._pending_vol = new_vol
+                self._vol_dirty.set()
+            self.ui.update_volume_label(new_vol)
+            self.ui.throttled_log("Volume adjusted: roll=%.2f -> Volume: %d%%", roll, new_vol * 100)
+        else:
+            if not self.ui.last_volume_disabled_logged:
+                self.ui.log_message("Volume control disabled (phone not held level)")
+                self.ui.last_volume_disabled_logged = True
+
+        # Play/Pause Gesture: when phone is tilted forward (pitch > -0.7)
+        # Trigger only if pitch changes by more than 0.1 and cooldown has passed.
+        pitch_delta_threshold = 0.1
+        if pitch > -0.7:
+            current_time = time.time()
+            if ((self.previous_pitch is None or abs(pitch - self.previous_pitch) > pitch_delta_threshold) and
+                (current_time - self.last_pitch_time > gesture_cooldown)):
+                keyboard.send("play/pause media")
+                self.last_pitch_time = current_time
+                self.ui.log_message("Gesture detected: Toggling Play/Pause")
+        self.previous_pitch = pitch
+        self.previous_yaw = yaw
+
+    async def _volume_writer(self):
+        """
+        Write the latest pending volume to the audio endpoint whenever it changes.
+        The task sleeps on an event while the volume is unchanged; after each write it
+        waits volume_write_interval, so bursts of notifications collapse into at most
+        one write per interval. The blocking COM call runs in a worker thread so the
+        event loop keeps draining notifications meanwhile.
+        """
+        while True:
+            await self._vol_dirty.wait()
+            await self._write_pending_volume()
+            await asyncio.sleep(volume_write_interval)
+
+    async def _write_pending_volume(self):
+        """
+        Write _pending_vol to the audio endpoint, logging (not raising) COM errors so a
+        failed write doesn't end the writer; the next volume change tries again.
+        """
+        self._vol_dirty.clear()
+        vol = self._pending_vol
+        try:
+            await asyncio.to_thread(self._volume_control.SetMasterVolumeLevelScalar, vol, None)
+            self._written_vol = vol
+        except Exception as e:
+            self.ui.log_message(f"Volume write error: {e}")
@@ -0,0 +1,29 @@
+"""
+File: ble/sensor_packet.py
+Parses the sensor notification payload sent by the BLE peripheral.
+Kept free of Bleak/pycaw imports so it can be used and tested on its own.
+"""
+
+import struct
+
+# Sensor packet: roll, pitch, yaw as three little-endian float32 values (12 bytes).
+_SENSOR_FRAME = struct.Struct("<fff")
+_UNPACK = _SENSOR_FRAME.unpack_from
+
+# Every byte that can appear in a legacy "roll,pitch,yaw" ASCII payload.
+_ASCII_FLOAT_BYTES = b"0123456789+-.eE, \r\n"
+
+def parse_sensor_packet(data: bytearray):
+    """
+    Parse a notification payload into a (roll, pitch, yaw) tuple, or None if incomplete.
+    Binary frames are preferred; the legacy "roll,pitch,yaw" ASCII payload is still accepted.
+    A 12-byte payload is only treated as ASCII when every byte is an ASCII float character,
+    since packed floats can contain any byte value, including ",".
+    """
+    if len(data) == _SENSOR_FRAME.size and data.translate(None, _ASCII_FLOAT_BYTES):
+        return _UNPACK(data)
+    # float() parses bytes directly and ignores surrounding whitespace.
+    parts = data.split(b",", 3)
+    if len(parts) >= 3:
+        return float(parts[0]), float(parts[1]), float(parts[2])
+    return None
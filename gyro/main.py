@@ -3,6 +3,7 @@ File: monolith.py
 Entry point for the BLE Gyro Volume Controller application.
 """
 
+import sys
 import threading
 import tkinter as tk
 import asyncio
@@ -12,8 +13,15 @@ from ble.ble_client import BLEClient
 # Global variable for the BLE thread.
 ble_thread = None
 
+# On Windows the BLE loop runs on the selector loop: it has less per-iteration overhead
+# than the default proactor loop, and bleak's WinRT backend does not need proactor I/O.
+USE_SELECTOR_LOOP = sys.platform == "win32"
+
 def start_ble_loop(ui_manager):
-    asyncio.run(BLEClient(ui_manager).run())
+    if USE_SELECTOR_LOOP and sys.version_info >= (3, 12):
+        asyncio.run(BLEClient(ui_manager).run(), loop_factory=asyncio.SelectorEventLoop)
+    else:
+        asyncio.run(BLEClient(ui_manager).run())
 
 def refresh_ble(ui_manager):
     """
@@ -25,6 +33,10 @@ def refresh_ble(ui_manager):
     ble_thread.start()
 
 def main():
+    if USE_SELECTOR_LOOP and sys.version_info < (3, 12):
+        # Without loop_factory the process-wide policy is the only option; set it once
+        # before any BLE thread starts.
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
     root = tk.Tk()
     ui_manager = UIManager(root)
     ui_manager.set_refresh_callback(lambda: refresh_ble(ui_manager))
@@ -8,6 +8,7 @@ P.S: This is the initial monolith app, it works standalone without the need of o
 
 
 import asyncio
+import struct
 import threading
 import tkinter as tk
 import time
@@ -23,6 +24,7 @@ logging.basicConfig(level=logging.INFO)
 # BLE service and characteristic UUIDs
 SERVICE_UUID = "0000a000-0000-1000-8000-00805f9b34fb"
 CHARACTERISTIC_UUID = "0000a001-0000-1000-8000-00805f9b34fb"
+SERVICE_UUID_LC = SERVICE_UUID.lower()
 
 # Global variables for gesture and volume control
 previous_yaw = None
@@ -31,6 +33,7 @@ last_pitch_time = 0
 last_gesture_time = 0
 yaw_threshold = 0.3         # Threshold for detecting play/pause gesture based on yaw change
 gesture_cooldown = 1.0      # Cooldown (seconds) between gesture triggers
+volume_quantum = 0.01       # Minimum volume change (1%) worth writing to the audio endpoint
 
 # Pitch range used for mapping (if needed)
 min_pitch = -1.0
@@ -43,11 +46,37 @@ def map_pitch_to_volume(pitch: float) -> float:
     pitch = max(min_pitch, min(max_pitch, pitch))
     return (pitch - min_pitch) / (max_pitch - min_pitch)
 
+# Sensor packet: roll, pitch, yaw as three little-endian float32 values (12 bytes).
+_SENSOR_FRAME = struct.Struct("<fff")
+_UNPACK = _SENSOR_FRAME.unpack_from
+
+# Every byte that can appear in a legacy "roll,pitch,yaw" ASCII payload.
+_ASCII_FLOAT_BYTES = b"0123456789+-.eE, \r\n"
+
+def parse_sensor_packet(data: bytearray):
+    """
+    Parse a notification payload into a (roll, pitch, yaw) tuple, or None if incomplete.
+    Binary frames are preferred; the legacy "roll,pitch,yaw" ASCII payload is still accepted.
+    A 12-byte payload is only treated as ASCII when every byte is an ASCII float character,
+    since packed floats can contain any byte value, including ",".
+    """
+    if len(data) == _SENSOR_FRAME.size and data.translate(None, _ASCII_FLOAT_BYTES):
+        return _UNPACK(data)
+    # float() parses bytes directly and ignores surrounding whitespace.
+    parts = data.split(b",", 3)
+    if len(parts) >= 3:
+        return float(parts[0]), float(parts[1]), float(parts[2])
+    return None
+
 # --- Setup for Windows Volume Control (using pycaw) ---
 devices_audio = AudioUtilities.GetSpeakers()
 interface = devices_audio.Activate(IAudioEndpointVolume._iid_, 3, None)  # CLSCTX_ALL = 3
 volume_control = cast(interface, POINTER(IAudioEndpointVolume))
 
+# Cached volume state, so notifications don't need a COM read each time
+cached_vol = volume_control.GetMasterVolumeLevelScalar()
+written_vol = cached_vol
+
 # --- Tkinter GUI Setup ---
 root = tk.Tk()
 root.title("BLE Gyro Volume Controller")
@@ -119,7 +148,7 @@ async def ble_client_task():
     devices = await BleakScanner.discover()
     target = None
     for d in devices:
-        if SERVICE_UUID.lower() in [s.lower() for s in d.metadata.get("uuids", [])]:
+        if any(s.lower() == SERVICE_UUID_LC for s in d.metadata.get("uuids", ())):
             target = d
             break
     if target is None:
@@ -131,7 +160,9 @@ async def ble_client_task():
     root.after(0, lambda: (conn_status_label.config(text=f"BLE: Connected to {target.address}"),
                            conn_status_icon.config(text="✅")))
 
-    async with BleakClient(target.address) as client:
+    disconnect_event = asyncio.Event()
+    async with BleakClient(target.address,
+                           disconnected_callback=lambda c: disconnect_event.set()) as client:
         if not client.is_connected:
             log_message("Failed to connect.")
             return
@@ -145,18 +176,17 @@ async def ble_client_task():
             - If the phone is tilted forward (pitch > -0.7) and the pitch changes significantly, trigger play/pause.
             """
             global previous_yaw, last_gesture_time, previous_pitch, last_pitch_time, last_volume_disabled_logged
+            global cached_vol, written_vol
             try:
-                decoded = data.decode("utf-8").strip()
-                values = decoded.split(",")
-                if len(values) >= 3:
-                    # Parse sensor values: roll, pitch, yaw
-                    roll, pitch, yaw = map(float, values[:3])
+                values = parse_sensor_packet(data)
+                if values is not None:
+                    roll, pitch, yaw = values
                     root.after(0, lambda: update_sensor_labels(roll, pitch, yaw))
 
                     # Volume Adjustment: when phone is held level (pitch between -1.5 and -0.5)
                     if -1.5 <= pitch <= -0.5:
                         last_volume_disabled_logged = False  # Reset flag when phone is level
-                        current_vol = volume_control.GetMasterVolumeLevelScalar()
+                        current_vol = cached_vol
                         tilt_threshold = 0.2  # Deadzone for roll
                         rate_factor = 0.02    # Sensitivity factor for volume change
                         new_vol = current_vol
@@ -165,7 +195,12 @@ async def ble_client_task():
                         elif roll > tilt_threshold:
                             new_vol = current_vol + rate_factor * (roll - tilt_threshold)
                         new_vol = max(0.0, min(1.0, new_vol))
-                        volume_control.SetMasterVolumeLevelScalar(new_vol, None)
+                        cached_vol = new_vol
+                        # Only write when the change is noticeable, or when hitting a bound.
+                        if (abs(new_vol - written_vol) > volume_quantum or
+                                (new_vol != written_vol and new_vol in (0.0, 1.0))):
+                            volume_control.SetMasterVolumeLevelScalar(new_vol, None)
+                            written_vol = new_vol
                         root.after(0, lambda: update_volume_label(new_vol))
                         throttled_log(f"Volume adjusted: roll={roll:.2f} -> Volume: {int(new_vol * 100)}%")
                     else:
@@ -197,9 +232,8 @@ async def ble_client_task():
                 log_message(f"Failed to start notify: {e}. Retrying in 5 seconds...")
                 await asyncio.sleep(5)
 
-        # Keep the connection alive while the client remains connected.
-        while client.is_connected:
-            await asyncio.sleep(1)
+        # Keep the connection alive until the device disconnects.
+        await disconnect_event.wait()
         try:
             await client.stop_notify(CHARACTERISTIC_UUID)
         except Exception as e:
@@ -0,0 +1,44 @@
+"""
+File: tests/test_sensor_packet.py
+Checks for parse_sensor_packet. Run from the gyro directory:
+    python -m unittest discover -s tests -t .
+"""
+
+import struct
+import unittest
+from ble.sensor_packet import parse_sensor_packet
+
+class ParseSensorPacketTest(unittest.TestCase):
+    def assertValues(self, values, expected):
+        self.assertIsNotNone(values)
+        for got, want in zip(values, expected):
+            self.assertAlmostEqual(got, want, places=5)
+
+    def test_binary_frame(self):
+        data = bytearray(struct.pack("<fff", 0.25, -1.0, 0.5))
+        self.assertValues(parse_sensor_packet(data), (0.25, -1.0, 0.5))
+
+    def test_binary_frame_containing_comma_byte(self):
+        data = bytearray(struct.pack("<fff", 0.1, -1.0, 0.5))
+        data[0] = 0x2C
+        self.assertIn(b",", data)
+        expected = struct.unpack("<fff", data)
+        self.assertValues(parse_sensor_packet(data), expected)
+
+    def test_ascii_payload(self):
+        data = bytearray(b"0.12,-1.03,0.55\n")
+        self.assertValues(parse_sensor_packet(data), (0.12, -1.03, 0.55))
+
+    def test_twelve_byte_ascii_payload(self):
+        data = bytearray(b"0.1,-1.0,0.5")
+        self.assertEqual(len(data), 12)
+        self.assertValues(parse_sensor_packet(data), (0.1, -1.0, 0.5))
+
+    def test_ascii_payload_with_extra_fields(self):
+        self.assertValues(parse_sensor_packet(b"1.5,2.5,3.5,4.5"), (1.5, 2.5, 3.5))
+
+    def test_incomplete_payload(self):
+        self.assertIsNone(parse_sensor_packet(bytearray(b"0.1,0.2")))
+
+if __name__ == "__main__":
+    unittest.main()
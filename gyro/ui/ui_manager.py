@@ -4,8 +4,8 @@ Defines the UIManager class that encapsulates the Tkinter GUI.
 This class manages:
   - Connection status updates (with icon)
   - Sensor label updates
-  - Volume display updates
-  - Logging (with throttling)
+  - Volume display updates (coalesced and applied on a fixed UI tick)
+  - Logging (with throttling, bounded to the most recent lines)
   - A refresh button to restart the BLE process
 """
 
@@ -20,9 +20,14 @@ class UIManager:
         self.root = root
         self.last_log_time = 0
         self.LOG_INTERVAL = 2.0
+        self.LOG_MAX_LINES = 500
         self.last_volume_disabled_logged = False
         self.refresh_callback = None
+        # Latest sensor/volume values written by the BLE thread, applied by _flush_ui.
+        self._pending = {}
+        self.UI_REFRESH_MS = 50
         self.setup_gui()
+        self.root.after(self.UI_REFRESH_MS, self._flush_ui)
 
     def set_refresh_callback(self, callback):
         self.refresh_callback = callback
@@ -32,21 +37,28 @@ class UIManager:
         # Connection status frame with icon and label.
         self.conn_frame = tk.Frame(self.root)
         self.conn_frame.pack(pady=5)
-        self.conn_status_icon = tk.Label(self.conn_frame, text="❌", font=("Arial", 16))
+        # Label texts are bound to StringVars, so updates only set the variable.
+        self.conn_icon_var = tk.StringVar(value="❌")
+        self.conn_status_var = tk.StringVar(value="BLE: Not connected")
+        self.volume_var = tk.StringVar(value="Windows Volume: 0%")
+        self.roll_var = tk.StringVar(value="Roll: 0.00")
+        self.pitch_var = tk.StringVar(value="Pitch: 0.00")
+        self.yaw_var = tk.StringVar(value="Yaw: 0.00")
+        self.conn_status_icon = tk.Label(self.conn_frame, textvariable=self.conn_icon_var, font=("Arial", 16))
         self.conn_status_icon.pack(side=tk.LEFT, padx=5)
-        self.conn_status_label = tk.Label(self.conn_frame, text="BLE: Not connected", font=("Arial", 12))
+        self.conn_status_label = tk.Label(self.conn_frame, textvariable=self.conn_status_var, font=("Arial", 12))
         self.conn_status_label.pack(side=tk.LEFT)
         # Volume display label.
-        self.volume_label = tk.Label(self.root, text="Windows Volume: 0%", font=("Arial", 16))
+        self.volume_label = tk.Label(self.root, textvariable=self.volume_var, font=("Arial", 16))
         self.volume_label.pack(pady=5)
         # Sensor values display: Roll, Pitch, Yaw.
         self.sensor_frame = tk.Frame(self.root)
         self.sensor_frame.pack(pady=5)
-        self.roll_label = tk.Label(self.sensor_frame, text="Roll: 0.00", font=("Arial", 14))
+        self.roll_label = tk.Label(self.sensor_frame, textvariable=self.roll_var, font=("Arial", 14))
         self.roll_label.grid(row=0, column=0, padx=5)
-        self.pitch_label = tk.Label(self.sensor_frame, text="Pitch: 0.00", font=("Arial", 14))
+        self.pitch_label = tk.Label(self.sensor_frame, textvariable=self.pitch_var, font=("Arial", 14))
         self.pitch_label.grid(row=0, column=1, padx=5)
-        self.yaw_label = tk.Label(self.sensor_frame, text="Yaw: 0.00", font=("Arial", 14))
+        self.yaw_label = tk.Label(self.sensor_frame, textvariable=self.yaw_var, font=("Arial", 14))
         self.yaw_label.grid(row=0, column=2, padx=5)
         # Refresh button to restart BLE process.
         self.refresh_button = tk.Button(self.root, text="Refresh BLE", command=self.refresh_ble)
@@ -61,27 +73,61 @@ class UIManager:
             self.refresh_callback()
 
     def update_connection_status(self, address: str, connected: bool = True):
+        self.root.after(0, self._apply_connection_status, address, connected)
+
+    def _apply_connection_status(self, address: str, connected: bool):
         if connected:
-            self.root.after(0, lambda: self.conn_status_label.config(text=f"BLE: Connected to {address}"))
-            self.root.after(0, lambda: self.conn_status_icon.config(text="✅"))
+            self.conn_status_var.set("BLE: Connected to %s" % address)
+            self.conn_icon_var.set("✅")
         else:
-            self.root.after(0, lambda: self.conn_status_label.config(text="BLE: Not connected"))
-            self.root.after(0, lambda: self.conn_status_icon.config(text="❌"))
+            self.conn_status_var.set("BLE: Not connected")
+            self.conn_icon_var.set("❌")
 
     def update_volume_label(self, vol: float):
-        vol_percent = int(vol * 100)
-        self.root.after(0, lambda: self.volume_label.config(text=f"Windows Volume: {vol_percent}%"))
+        self._pending["volume"] = vol
 
     def update_sensor_labels(self, roll: float, pitch: float, yaw: float):
-        self.root.after(0, lambda: self.roll_label.config(text=f"Roll: {roll:.2f}"))
-        self.root.after(0, lambda: self.pitch_label.config(text=f"Pitch: {pitch:.2f}"))
-        self.root.after(0, lambda: self.yaw_label.config(text=f"Yaw: {yaw:.2f}"))
+        self._pending["sensors"] = (roll, pitch, yaw)
+
+    def _flush_ui(self):
+        """
+        Apply the latest pending values to the widgets, then reschedule itself.
+        Runs on the Tk thread, so BLE notification rate never drives Tk event rate.
+        Keys are popped from the one shared dict (each pop is atomic), so a value the
+        BLE thread stores meanwhile is kept for the next tick rather than lost.
+        """
+        vol = self._pending.pop("volume", None)
+        if vol is not None:
+            self.volume_var.set("Windows Volume: %d%%" % (vol * 100))
+        sensors = self._pending.pop("sensors", None)
+        if sensors is not None:
+            self._apply_sensor_labels(*sensors)
+        self.root.after(self.UI_REFRESH_MS, self._flush_ui)
+
+    def _apply_sensor_labels(self, roll: float, pitch: float, yaw: float):
+        self.roll_var.set("Roll: %.2f" % roll)
+        self.pitch_var.set("Pitch: %.2f" % pitch)
+        self.yaw_var.set("Yaw: %.2f" % yaw)
 
     def log_message(self, message: str):
-        self.root.after(0, lambda: (self.log_text.insert(tk.END, f"{message}\n"), self.log_text.see(tk.END)))
+        self.root.after(0, self._append_log, message)
+
+    def _append_log(self, message: str):
+        self.log_text.insert(tk.END, f"{message}\n")
+        # Count actual text lines (messages may span several), excluding the "Logs:"
+        # header on line 1 and the empty line after the final newline.
+        log_lines = int(self.log_text.index("end-1c").split(".")[0]) - 2
+        excess = log_lines - self.LOG_MAX_LINES
+        if excess > 0:
+            self.log_text.delete("2.0", f"{2 + excess}.0")
+        self.log_text.see(tk.END)
 
-    def throttled_log(self, message: str):
+    def throttled_log(self, fmt: str, *args):
+        """
+        Log at most once per LOG_INTERVAL. The message is %-formatted only when it
+        is actually emitted, so callers on the hot path don't pay for discarded logs.
+        """
         current_time = time.time()
         if current_time - self.last_log_time >= self.LOG_INTERVAL:
-            self.log_message(message)
+            self.log_message(fmt % args if args else fmt)
             self.last_log_time = current_time
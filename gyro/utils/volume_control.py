@@ -1,15 +1,35 @@
 """
 File: utils/volume_control.py
-Provides utility functions and globals for volume control.
-Sets up the Windows Volume Control using pycaw and defines a mapping function.
+Provides lazy access to the Windows Volume Control via pycaw, plus the utility
+functions mapping sensor values to volume.
 """
 
+import math
+import comtypes
 from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
 from ctypes import POINTER, cast
 
 min_pitch = -1.0
 max_pitch = 1.0
 
+# Roll-based volume adjustment
+tilt_threshold = 0.2        # Deadzone for roll
+rate_factor = 0.02          # Sensitivity factor for volume change
+
+# Lookup table of per-sample volume deltas, sampling roll uniformly over [-pi, pi].
+# Built once at import from tilt_threshold/rate_factor above.
+_ROLL_LUT_SIZE = 256
+_ROLL_LUT_SCALE = (_ROLL_LUT_SIZE - 1) / (2 * math.pi)
+
+def _roll_delta(roll: float) -> float:
+    if roll < -tilt_threshold:
+        return rate_factor * (roll + tilt_threshold)
+    if roll > tilt_threshold:
+        return rate_factor * (roll - tilt_threshold)
+    return 0.0
+
+_ROLL_LUT = tuple(_roll_delta(-math.pi + i / _ROLL_LUT_SCALE) for i in range(_ROLL_LUT_SIZE))
+
 def map_pitch_to_volume(pitch: float) -> float:
     """
     Map a pitch value from [min_pitch, max_pitch] to a volume scalar in [0.0, 1.0].
@@ -17,7 +37,36 @@ def map_pitch_to_volume(pitch: float) -> float:
     pitch = max(min_pitch, min(max_pitch, pitch))
     return (pitch - min_pitch) / (max_pitch - min_pitch)
 
-# Setup for Windows Volume Control (using pycaw)
-devices_audio = AudioUtilities.GetSpeakers()
-interface = devices_audio.Activate(IAudioEndpointVolume._iid_, 3, None)  # CLSCTX_ALL = 3
-volume_control = cast(interface, POINTER(IAudioEndpointVolume))
+def roll_to_delta(roll: float) -> float:
+    """
+    Look up the volume change for one roll sample (radians), using the nearest table
+    entry. Values outside [-pi, pi] use the outermost entries.
+    """
+    i = int((roll + math.pi) * _ROLL_LUT_SCALE + 0.5)
+    return _ROLL_LUT[0 if i < 0 else _ROLL_LUT_SIZE - 1 if i >= _ROLL_LUT_SIZE else i]
+
+def adjust_volume(roll: float, current_vol: float) -> float:
+    """
+    Compute the new volume scalar for one roll sample: tilting beyond the deadzone
+    moves the volume proportionally, and the result is clamped to [0.0, 1.0].
+    """
+    new_vol = current_vol + roll_to_delta(roll)
+    return 0.0 if new_vol < 0.0 else 1.0 if new_vol > 1.0 else new_vol
+
+# Windows Volume Control (using pycaw), activated on first use by get_volume_control()
+_volume_control = None
+
+def get_volume_control():
+    """
+    Return the IAudioEndpointVolume interface for the default speakers.
+    Every call joins the calling thread to the COM multithreaded apartment, so each
+    BLE thread (including ones started by "Refresh BLE") keeps the MTA alive for its
+    worker threads; the endpoint itself is activated once and cached.
+    """
+    global _volume_control
+    comtypes.CoInitializeEx(comtypes.COINIT_MULTITHREADED)
+    if _volume_control is None:
+        devices_audio = AudioUtilities.GetSpeakers()
+        interface = devices_audio.Activate(IAudioEndpointVolume._iid_, 3, None)  # CLSCTX_ALL = 3
+        _volume_control = cast(interface, POINTER(IAudioEndpointVolume))
+    return _volume_control